@@ -47,6 +47,14 @@ class Chord:
         self._calculate_duration()
         self._calculate_start_time()
 
+    def extend_notes(self, notes: List[Note]) -> None:
+        """
+        Add several notes to the chord, recalculating its start time and duration only once.
+        """
+        self.notes.extend(notes)
+        self._calculate_duration()
+        self._calculate_start_time()
+
     def get_chord(self) -> List[Note]:
         return self.notes
 
@@ -87,12 +87,13 @@ class DrumKit:
         :param duration: The duration of the drum sound.
         :param time: The time at which the drum sound should start.
         """
-        if drum_name not in GM1_DRUM_MAP:
+        pitch = GM1_DRUM_MAP.get(drum_name)
+        if pitch is None:
             raise ValueError(
                 f"Invalid drum name: {drum_name}. Please use a valid drum name from the GM1_DRUM_MAP."
             )
 
-        drum = Drum(GM1_DRUM_MAP[drum_name], velocity, duration, time)
+        drum = Drum(pitch, velocity, duration, time)
         self.drums.append(drum)
 
     def get_drums(self) -> List[Note]:
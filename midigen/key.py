@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 VALID_KEYS = [
     (note, mode)
     for note in [
@@ -24,6 +26,8 @@ VALID_KEYS = [
     for mode in ["major", "minor"]
 ]
 
+_VALID_KEY_SET = frozenset(VALID_KEYS)
+
 KEY_MAP = {
     "C0": 12,
     "C#0": 13,
@@ -181,23 +185,16 @@ KEY_MAP = {
 }
 
 
+@dataclass(frozen=True, slots=True)
 class Key:
-    def __init__(self, name: str, mode: str = "major"):
-        if (name, mode) not in VALID_KEYS:
+    name: str
+    mode: str = "major"
+
+    def __post_init__(self):
+        if (self.name, self.mode) not in _VALID_KEY_SET:
             raise ValueError(
                 f"Invalid key. Please use a valid key from the list: {format(VALID_KEYS)}"
             )
 
-        self.name = name
-        self.mode = mode
-
     def __str__(self) -> str:
         return f"{self.name}{'' if self.mode == 'major' else 'm'}"
-
-    def __repr__(self) -> str:
-        return f"Key(name='{self.name}', mode='{self.mode}')"
-
-    def __eq__(self, other) -> bool:
-        if isinstance(other, Key):
-            return self.name == other.name and self.mode == other.mode
-        return False
@@ -7,6 +7,18 @@ from midigen.track import Track
 from pathlib import Path
 
 
+DEFAULT_KEY_SIGNATURE = Key("C")  # Keys are immutable, so one shared default suffices
+ALLOWED_MODES = (
+    "major",
+    "dorian",
+    "phrygian",
+    "lydian",
+    "mixolydian",
+    "aeolian",
+    "locrian",
+)
+
+
 class MidiGen(MidiFile):
     def __init__(
         self,
@@ -27,7 +39,7 @@ class MidiGen(MidiFile):
 
         self.tempo = tempo
         self.time_signature = time_signature
-        self.key_signature = key_signature if key_signature else Key("C")
+        self.key_signature = key_signature if key_signature else DEFAULT_KEY_SIGNATURE
 
         self.set_tempo(self.tempo)
         self.set_time_signature(*self.time_signature)
@@ -141,18 +153,9 @@ class MidiGen(MidiFile):
         :param key_signature: The key signature, e.g. 'C'.
         :param mode: The mode, e.g. 'major', 'dorian', 'phrygian', 'lydian', 'mixolydian', 'aeolian', 'locrian'.
         """
-        allowed_modes = [
-            "major",
-            "dorian",
-            "phrygian",
-            "lydian",
-            "mixolydian",
-            "aeolian",
-            "locrian",
-        ]
-        if mode not in allowed_modes:
+        if mode not in ALLOWED_MODES:
             raise ValueError(
-                f"Invalid mode. Please use a valid mode from the list: {allowed_modes}"
+                f"Invalid mode. Please use a valid mode from the list: {list(ALLOWED_MODES)}"
             )
 
         self.mode = mode
@@ -172,8 +175,7 @@ class MidiGen(MidiFile):
         """
         self.midi_file.tracks.clear()
         for track in self.tracks:
-            track.add_note_off_messages()
-            self.midi_file.tracks.append(track.get_track())
+            self.midi_file.tracks.append(track.compile())
 
         # output_dir = os.path.join(os.getcwd(), "generate", "output")
         project_root = find_project_root()
@@ -3,6 +3,8 @@ NOTE_OFF = "note_off"
 
 
 class Note:
+    __slots__ = ("pitch", "velocity", "duration", "time")
+
     def __init__(self, pitch: int, velocity: int, duration: int, time: int):
         """
         param pitch: MIDI pitch value
@@ -20,10 +22,10 @@ class Note:
         return self
         
     def _validate_note(self) -> bool:
-        validate_attributes = ["pitch", "velocity"]
-        for attribute, value in self.__dict__.items():
-            if not 0 <= value <= 127 and not isinstance(attribute, int) and attribute in validate_attributes:
-               raise ValueError(f"Invalid {attribute}, must be an integer between 0 and 127.")
+        for attribute in ("pitch", "velocity"):
+            value = getattr(self, attribute)
+            if not isinstance(value, int) or not 0 <= value <= 127:
+                raise ValueError(f"Invalid {attribute}, must be an integer between 0 and 127.")
 
     def __str__(self):
         return f"Note(pitch={self.pitch}, velocity={self.velocity}, duration={self.duration}, time={self.time})"
@@ -3,145 +3,109 @@ from midigen.key import KEY_MAP
 from midigen.chord import Chord, ChordProgression, Arpeggio, ArpeggioPattern
 import unittest
 
+# Expected chord tones, built once. They share the root's velocity, duration and time.
+NOTES = {
+    name: Note(KEY_MAP[name], 64, 100, 0)
+    for name in ("C4", "D#4", "Eb4", "E4", "Gb4", "G4", "A4", "Bb4", "B4", "D5")
+}
+
+# Expected arpeggio sequences for C4, D4, E4 with a delay of 100 ticks
+ARPEGGIO_ASCENDING = (
+    Note(KEY_MAP["C4"], 64, 100, 0),
+    Note(KEY_MAP["D4"], 64, 100, 100),
+    Note(KEY_MAP["E4"], 64, 100, 200),
+)
+ARPEGGIO_DESCENDING = (
+    Note(KEY_MAP["E4"], 64, 100, 0),
+    Note(KEY_MAP["D4"], 64, 100, 100),
+    Note(KEY_MAP["C4"], 64, 100, 200),
+)
+ARPEGGIO_ALTERNATING_TWO_LOOPS = ARPEGGIO_ASCENDING + (
+    Note(KEY_MAP["E4"], 64, 100, 300),
+    Note(KEY_MAP["D4"], 64, 100, 400),
+    Note(KEY_MAP["C4"], 64, 100, 500),
+)
+
 
 class TestChord(unittest.TestCase):
-    def setUp(self):
-        self.notes = [Note(KEY_MAP["C4"], 64, 100, 0)]
-        self.chord = Chord(self.notes)
+    @classmethod
+    def setUpClass(cls):
+        # The chord builders return new notes, so read-only tests share one chord.
+        # Tests that add notes build their own.
+        cls.notes = [Note(KEY_MAP["C4"], 64, 100, 0)]
+        cls.chord = Chord(cls.notes)
 
     def test_chord_creation(self):
         self.assertEqual(self.chord.get_chord(), self.notes)
 
     def test_add_note(self):
+        chord = Chord([Note(KEY_MAP["C4"], 64, 100, 0)])
         new_note = Note(62, 64, 100, 100)
-        self.chord.add_note(new_note)
+        chord.add_note(new_note)
         self.assertEqual(
-            self.chord.get_chord(), [Note(KEY_MAP["C4"], 64, 100, 0), new_note]
+            chord.get_chord(), [Note(KEY_MAP["C4"], 64, 100, 0), new_note]
         )
 
+    def test_extend_notes(self):
+        new_notes = [Note(62, 64, 100, 100), Note(64, 64, 300, 50)]
+        chord = Chord([Note(KEY_MAP["C4"], 64, 100, 0)])
+        chord.extend_notes(new_notes)
+        self.assertEqual(chord.get_chord(), [Note(KEY_MAP["C4"], 64, 100, 0)] + new_notes)
+        self.assertEqual(chord.time, 0)
+        self.assertEqual(chord.duration, 350)
+
     def test_chord_triads(self):
         major_triad = self.chord.major_triad()
-        self.assertEqual(
-            major_triad,
-            [
-                Note(KEY_MAP["C4"], 64, 100, 0),
-                Note(KEY_MAP["E4"], 64, 100, 0),
-                Note(KEY_MAP["G4"], 64, 100, 0),
-            ],
-        )
+        self.assertEqual(major_triad, [NOTES["C4"], NOTES["E4"], NOTES["G4"]])
 
         minor_triad = self.chord.minor_triad()
-        self.assertEqual(
-            minor_triad,
-            [
-                Note(KEY_MAP["C4"], 64, 100, 0),
-                Note(KEY_MAP["D#4"], 64, 100, 0),
-                Note(KEY_MAP["G4"], 64, 100, 0),
-            ],
-        )
+        self.assertEqual(minor_triad, [NOTES["C4"], NOTES["D#4"], NOTES["G4"]])
 
     def test_chord_seventh(self):
         dominant_seventh = self.chord.dominant_seventh()
-        self.assertEqual(
-            dominant_seventh,
-            [
-                Note(KEY_MAP["C4"], 64, 100, 0),
-                Note(KEY_MAP["E4"], 64, 100, 0),
-                Note(KEY_MAP["G4"], 64, 100, 0),
-                Note(KEY_MAP["Bb4"], 64, 100, 0),
-            ],
-        )
+        self.assertEqual(dominant_seventh, [NOTES["C4"], NOTES["E4"], NOTES["G4"], NOTES["Bb4"]])
 
         major_seventh = self.chord.major_seventh()
-        self.assertEqual(
-            major_seventh,
-            [
-                Note(KEY_MAP["C4"], 64, 100, 0),
-                Note(KEY_MAP["E4"], 64, 100, 0),
-                Note(KEY_MAP["G4"], 64, 100, 0),
-                Note(KEY_MAP["B4"], 64, 100, 0),
-            ],
-        )
+        self.assertEqual(major_seventh, [NOTES["C4"], NOTES["E4"], NOTES["G4"], NOTES["B4"]])
 
     def test_minor_seventh_chord(self):
         minor_seventh = self.chord.minor_seventh()
-        self.assertEqual(
-            minor_seventh,
-            [
-                Note(KEY_MAP["C4"], 64, 100, 0),
-                Note(KEY_MAP["Eb4"], 64, 100, 0),
-                Note(KEY_MAP["G4"], 64, 100, 0),
-                Note(KEY_MAP["Bb4"], 64, 100, 0),
-            ],
-        )
+        self.assertEqual(minor_seventh, [NOTES["C4"], NOTES["Eb4"], NOTES["G4"], NOTES["Bb4"]])
 
     def test_half_diminished_seventh_chord(self):
         half_diminished_seventh = self.chord.half_diminished_seventh()
-        expected_notes = [
-            Note(
-                KEY_MAP[note],
-                self.chord.root.velocity,
-                self.chord.root.duration,
-                self.chord.root.time,
-            )
-            for note in ["C4", "Eb4", "Gb4", "Bb4"]
-        ]
+        expected_notes = [NOTES[name] for name in ("C4", "Eb4", "Gb4", "Bb4")]
         self.assertEqual(half_diminished_seventh, expected_notes)
 
     def test_diminished_seventh_chord(self):
         diminished_seventh = self.chord.diminished_seventh()
-        expected_notes = [
-            Note(
-                KEY_MAP[note],
-                self.chord.root.velocity,
-                self.chord.root.duration,
-                self.chord.root.time,
-            )
-            for note in ["C4", "Eb4", "Gb4", "A4"]
-        ]
+        expected_notes = [NOTES[name] for name in ("C4", "Eb4", "Gb4", "A4")]
         self.assertEqual(diminished_seventh, expected_notes)
 
     def test_minor_ninth_chord(self):
         minor_ninth = self.chord.minor_ninth()
-        expected_notes = [
-            Note(KEY_MAP["C4"], 64, 100, 0),
-            Note(KEY_MAP["Eb4"], 64, 100, 0),
-            Note(KEY_MAP["G4"], 64, 100, 0),
-            Note(KEY_MAP["Bb4"], 64, 100, 0),
-            Note(KEY_MAP["D4"] + 12, 64, 100, 0),
-        ]  # Note the "+ 12" here
-        self.assertEqual(minor_ninth, expected_notes)
+        # The ninth sits an octave above the second, so it is D5 rather than D4
+        self.assertListEqual(minor_ninth, [NOTES[name] for name in ("C4", "Eb4", "G4", "Bb4", "D5")])
 
     def test_dominant_ninth_chord(self):
         dominant_ninth = self.chord.dominant_ninth()
-        expected_notes = [
-            Note(KEY_MAP["C4"], 64, 100, 0),
-            Note(KEY_MAP["E4"], 64, 100, 0),
-            Note(KEY_MAP["G4"], 64, 100, 0),
-            Note(KEY_MAP["Bb4"], 64, 100, 0),
-            Note(KEY_MAP["D4"] + 12, 64, 100, 0),
-        ]  # And here
-        self.assertEqual(dominant_ninth, expected_notes)
+        self.assertListEqual(dominant_ninth, [NOTES[name] for name in ("C4", "E4", "G4", "Bb4", "D5")])
 
     def test_major_ninth_chord(self):
         major_ninth = self.chord.major_ninth()
-        expected_major_ninth = [
-            Note(KEY_MAP["C4"], 64, 100, 0),
-            Note(KEY_MAP["E4"], 64, 100, 0),
-            Note(KEY_MAP["G4"], 64, 100, 0),
-            Note(KEY_MAP["B4"], 64, 100, 0),
-            Note(KEY_MAP["D4"], 64, 100, 0) + 12,
-        ]  # Increase the octave for the ninth note
-        for note_actual, note_expected in zip(major_ninth, expected_major_ninth):
-            self.assertEqual(note_actual, note_expected)
+        self.assertListEqual(major_ninth, [NOTES[name] for name in ("C4", "E4", "G4", "B4", "D5")])
 
 
 class TestChordProgression(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Progressions never modify their chords, so only the progression is rebuilt per test
+        cls.root_note1 = Note(KEY_MAP["C4"], 64, 100, 0)
+        cls.root_note2 = Note(KEY_MAP["D4"], 64, 100, 0)
+        cls.chord1 = Chord([cls.root_note1])
+        cls.chord2 = Chord([cls.root_note2])
+
     def setUp(self):
-        self.root_note1 = Note(KEY_MAP["C4"], 64, 100, 0)
-        self.root_note2 = Note(KEY_MAP["D4"], 64, 100, 0)
-        self.chord1 = Chord([self.root_note1])
-        self.chord2 = Chord([self.root_note2])
         self.progression = ChordProgression([self.chord1, self.chord2])
 
     def test_add_chord(self):
@@ -175,15 +139,16 @@ class TestChordProgression(unittest.TestCase):
 
 
 class TestArpeggio(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # Updated to use the new KEY_MAP with octaves
-        self.notes = [
+        cls.notes = [
             Note(KEY_MAP["C4"], 64, 100, 0),
             Note(KEY_MAP["D4"], 64, 100, 0),
             Note(KEY_MAP["E4"], 64, 100, 0),
         ]
-        self.arpeggio = Arpeggio(
-            self.notes, delay=100, pattern=ArpeggioPattern.ASCENDING, loops=1
+        cls.arpeggio = Arpeggio(
+            cls.notes, delay=100, pattern=ArpeggioPattern.ASCENDING, loops=1
         )
 
     def test_arpeggio_creation(self):
@@ -191,50 +156,25 @@ class TestArpeggio(unittest.TestCase):
 
     def test_get_sequential_notes(self):
         sequential_notes = self.arpeggio.get_sequential_notes()
-        self.assertEqual(
-            sequential_notes,
-            [
-                Note(KEY_MAP["C4"], 64, 100, 0),
-                Note(KEY_MAP["D4"], 64, 100, 100),
-                Note(KEY_MAP["E4"], 64, 100, 200),
-            ],
-        )
+        self.assertEqual(sequential_notes, list(ARPEGGIO_ASCENDING))
 
     def test_get_sequential_notes_ascending(self):
         arpeggio = Arpeggio(
             self.notes, delay=100, pattern=ArpeggioPattern.ASCENDING, loops=1
         )
         sequential_notes = arpeggio.get_sequential_notes()
-        expected_notes = [
-            Note(KEY_MAP["C4"], 64, 100, 0),
-            Note(KEY_MAP["D4"], 64, 100, 100),
-            Note(KEY_MAP["E4"], 64, 100, 200),
-        ]
-        self.assertEqual(sequential_notes, expected_notes)
+        self.assertEqual(sequential_notes, list(ARPEGGIO_ASCENDING))
 
     def test_get_sequential_notes_descending(self):
         arpeggio = Arpeggio(
             self.notes, delay=100, pattern=ArpeggioPattern.DESCENDING, loops=1
         )
         sequential_notes = arpeggio.get_sequential_notes()
-        expected_notes = [
-            Note(KEY_MAP["E4"], 64, 100, 0),
-            Note(KEY_MAP["D4"], 64, 100, 100),
-            Note(KEY_MAP["C4"], 64, 100, 200),
-        ]
-        self.assertEqual(sequential_notes, expected_notes)
+        self.assertEqual(sequential_notes, list(ARPEGGIO_DESCENDING))
 
     def test_get_sequential_notes_alternating(self):
         arpeggio = Arpeggio(
             self.notes, delay=100, pattern=ArpeggioPattern.ALTERNATING, loops=2
         )
         sequential_notes = arpeggio.get_sequential_notes()
-        expected_notes = [
-            Note(KEY_MAP["C4"], 64, 100, 0),
-            Note(KEY_MAP["D4"], 64, 100, 100),
-            Note(KEY_MAP["E4"], 64, 100, 200),
-            Note(KEY_MAP["E4"], 64, 100, 300),
-            Note(KEY_MAP["D4"], 64, 100, 400),
-            Note(KEY_MAP["C4"], 64, 100, 500),
-        ]
-        self.assertEqual(sequential_notes, expected_notes)
+        self.assertEqual(sequential_notes, list(ARPEGGIO_ALTERNATING_TWO_LOOPS))
@@ -1,11 +1,15 @@
+from dataclasses import FrozenInstanceError
 from midigen.key import Key, VALID_KEYS
 import unittest
 
 class TestKey(unittest.TestCase):
-    def test_repr(self):
+    def test_all_valid_keys(self):
         for note, mode in VALID_KEYS:
-            key = Key(note, mode)
-            self.assertEqual(repr(key), f"Key(name='{note}', mode='{mode}')")
+            with self.subTest(note=note, mode=mode):
+                key = Key(note, mode)
+                self.assertEqual(key.name, note)
+                self.assertEqual(key.mode, mode)
+                self.assertEqual(repr(key), f"Key(name='{note}', mode='{mode}')")
 
     def test_key_creation(self):
         c_major = Key("C", "major")
@@ -35,8 +39,11 @@ class TestKey(unittest.TestCase):
         a_minor = Key("A", "minor")
         self.assertNotEqual(c_major, a_minor)
 
-    def test_all_valid_keys(self):
-        for note, mode in VALID_KEYS:
-            key = Key(note, mode)
-            self.assertEqual(key.name, note)
-            self.assertEqual(key.mode, mode)
+    def test_key_hashable(self):
+        keys = {Key("C", "major"), Key("C", "major"), Key("A", "minor")}
+        self.assertEqual(len(keys), 2)
+
+    def test_key_immutable(self):
+        key = Key("C", "major")
+        with self.assertRaises(FrozenInstanceError):
+            key.name = "D"
@@ -47,6 +47,14 @@ class TestMidigen(unittest.TestCase):
         expected_tempo = bpm2tempo(90)
         self.assertEqual(tempo_msgs[0].tempo, expected_tempo)
 
+    def test_set_tempo_updates_every_track(self):
+        self.midi_gen.add_track()
+        self.midi_gen.set_tempo(90)
+        for track in self.midi_gen.tracks:
+            tempo_msgs = [msg for msg in track.get_track() if msg.type == "set_tempo"]
+            self.assertEqual(len(tempo_msgs), 1)
+            self.assertEqual(tempo_msgs[0].tempo, bpm2tempo(90))
+
     def test_set_time_signature(self):
         self.midi_gen.set_time_signature(3, 4)
         active_track = self.midi_gen.get_active_track()
@@ -26,6 +26,21 @@ class TestNote(unittest.TestCase):
         with self.assertRaises(ValueError):
             Note(128, 64, 100, 0)
 
+    def test_invalid_velocity_value(self):
+        with self.assertRaises(ValueError):
+            Note(KEY_MAP["C4"], -1, 100, 0)
+        with self.assertRaises(ValueError):
+            Note(KEY_MAP["C4"], 128, 100, 0)
+
+    def test_non_integer_pitch_or_velocity(self):
+        with self.assertRaises(ValueError):
+            Note(60.5, 64, 100, 0)
+        with self.assertRaises(ValueError):
+            Note(KEY_MAP["C4"], 64.0, 100, 0)
+
+    def test_note_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.note, "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
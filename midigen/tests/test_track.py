@@ -1,10 +1,23 @@
 from midigen.midigen import MidiGen
 from midigen.note import Note
-from midigen.key import KEY_MAP
-from midigen.chord import Chord, Arpeggio
-from midigen.track import MAX_MIDI_TICKS
+from midigen.key import Key, KEY_MAP
+from midigen.chord import Chord, ChordProgression, Arpeggio
+from midigen.drums import DrumKit
+from midigen.track import MAX_MIDI_TICKS, Track
+from collections import defaultdict
+from mido import bpm2tempo
 import unittest
 
+C4, E4, G4 = KEY_MAP["C4"], KEY_MAP["E4"], KEY_MAP["G4"]
+
+
+def _bucket(messages):
+    """Group messages by type in a single pass over the track."""
+    buckets = defaultdict(list)
+    for msg in messages:
+        buckets[msg.type].append(msg)
+    return buckets
+
 
 class TestTrack(unittest.TestCase):
     def setUp(self):
@@ -12,13 +25,12 @@ class TestTrack(unittest.TestCase):
         self.track = self.midi_gen.get_active_track()
 
     def test_add_note(self):
-        new_note = Note(KEY_MAP["C4"], 64, 127, 0)
+        new_note = Note(C4, 64, 127, 0)
         self.track.add_note(new_note)
-        messages = self.track.get_track()
         note_on_msgs = [
             msg
-            for msg in messages
-            if msg.type == "note_on" and msg.note == new_note.pitch
+            for msg in _bucket(self.track.get_track())["note_on"]
+            if msg.note == new_note.pitch
         ]
 
         self.assertEqual(len(note_on_msgs), 1, "Should have one note_on message")
@@ -26,30 +38,44 @@ class TestTrack(unittest.TestCase):
             note_on_msgs[0].velocity, new_note.velocity, "Velocity should match"
         )
 
+    def test_add_notes(self):
+        notes = [Note(C4, 64, 120, 0), Note(E4, 64, 120, 120), Note(G4, 64, 120, 240)]
+        self.track.add_notes(notes)
+        self.assertEqual(self.track.get_notes(), notes)
+
+        messages = _bucket(self.track.get_track())
+        self.assertEqual([msg.note for msg in messages["note_on"]], [C4, E4, G4])
+        self.assertEqual(len(messages["note_off"]), 3)
+
     def test_add_chord(self):
-        new_note = Note(KEY_MAP["C4"], velocity=64, duration=120, time=0)
+        new_note = Note(C4, velocity=64, duration=120, time=0)
         chord = Chord([new_note, new_note + 4, new_note + 7])  # Simple C major triad
         self.track.add_chord(chord)
-        messages = self.track.get_track()
-
-        note_on_msgs = [msg for msg in messages if msg.type == "note_on"]
+        note_on_msgs = _bucket(self.track.get_track())["note_on"]
 
         # Assuming 3 notes in the chord, each with a note_on and note_off
         self.assertEqual(
             len(note_on_msgs), 3, "Should have 3 note_on messages for the chord"
         )
 
+    def test_add_chord_progression(self):
+        first = Chord([Note(C4, 64, 120, 0), Note(E4, 64, 120, 0)])
+        second = Chord([Note(E4, 64, 120, 120), Note(G4, 64, 120, 120)])
+        self.track.add_chord_progression(ChordProgression([first, second]))
+
+        self.assertEqual(self.track.get_notes(), first.get_chord() + second.get_chord())
+        note_on_msgs = _bucket(self.track.get_track())["note_on"]
+        self.assertEqual([msg.note for msg in note_on_msgs], [C4, E4, E4, G4])
+
     def test_add_arpeggio(self):
         notes = [
-            Note(KEY_MAP["C4"], 64, 100, 0),
-            Note(KEY_MAP["E4"], 64, 100, 100),
-            Note(KEY_MAP["G4"], 64, 100, 200),
+            Note(C4, 64, 100, 0),
+            Note(E4, 64, 100, 100),
+            Note(G4, 64, 100, 200),
         ]
         arpeggio = Arpeggio(notes)
         self.track.add_arpeggio(arpeggio)
-        messages = self.track.get_track()
-
-        note_on_msgs = [msg for msg in messages if msg.type == "note_on"]
+        note_on_msgs = _bucket(self.track.get_track())["note_on"]
 
         self.assertEqual(
             len(note_on_msgs), 3, "Should have 3 note_on messages for the arpeggio"
@@ -61,6 +87,60 @@ class TestTrack(unittest.TestCase):
         quantized_value = self.track.quantize(time_value, quantization_value)
         self.assertEqual(quantized_value, 128)
 
+    def test_quantize_grids(self):
+        for time_value, quantization_value, expected in [
+            (0, 128, 0),
+            (63, 128, 0),
+            (64, 128, 128),
+            (300, 128, 256),
+            (59, 120, 0),
+            (60, 120, 120),
+            (250, 120, 240),
+        ]:
+            with self.subTest(time_value=time_value, quantization_value=quantization_value):
+                self.assertEqual(self.track.quantize(time_value, quantization_value), expected)
+
+    def test_quantize_all(self):
+        for quantization_value in (120, 128):
+            with self.subTest(quantization_value=quantization_value):
+                notes = [Note(C4, 64, 100, time) for time in (0, 50, 70, 130, 250)]
+                expected = [self.track.quantize(note.time, quantization_value) for note in notes]
+                track = Track()
+                track.add_notes(notes)
+                track.quantize_all(quantization_value)
+                self.assertEqual([note.time for note in track.get_notes()], expected)
+
+    def test_quantize_all_leaves_shared_notes_alone(self):
+        shared_note = Note(C4, 64, 50, 50)
+        other_track = Track()
+        other_track.add_note(shared_note)
+        self.track.add_note(shared_note)
+
+        notes = self.track.get_notes()
+        self.track.quantize_all(128)
+        self.assertIs(self.track.get_notes(), notes)
+        self.assertEqual(notes[0].time, 0)
+        self.assertEqual(shared_note.time, 50)
+        self.assertEqual([msg.time for msg in other_track.compile()], [50, 50])
+
+    def test_quantize_all_rejects_negative_times(self):
+        self.track.add_notes([Note(C4, 64, 100, 100), Note(E4, 64, 100, -10)])
+        with self.assertRaises(ValueError):
+            self.track.quantize_all(128)
+        self.assertEqual([note.time for note in self.track.get_notes()], [100, -10])
+
+    def test_quantize_float_values(self):
+        self.assertEqual(self.track.quantize(100, 50.0), 100.0)
+        self.assertEqual(self.track.quantize(130.0, 64), 128)
+
+    def test_quantize_float_ties_round_up(self):
+        for time_value, quantization_value in ((64.0, 128), (320.0, 128), (60, 120.0)):
+            with self.subTest(time_value=time_value, quantization_value=quantization_value):
+                self.assertEqual(
+                    self.track.quantize(time_value, quantization_value),
+                    self.track.quantize(int(time_value), int(quantization_value)),
+                )
+
     def test_quantize_edge_cases(self):
         # Test that the quantization value doesn't exceed the maximum MIDI ticks
         time_value = 5000
@@ -74,67 +154,66 @@ class TestTrack(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.track.quantize(time_value, quantization_value)
 
+        # A zero step has no grid to snap to
+        with self.assertRaises(ValueError):
+            self.track.quantize(100, 0)
+
     def test_add_program_change(self):
         self.track.add_program_change(channel=0, program=42)
-        program_change_msgs = [
-            msg for msg in self.track.get_track() if msg.type == "program_change"
-        ]
+        program_change_msgs = _bucket(self.track.get_track())["program_change"]
         self.assertEqual(len(program_change_msgs), 1)
         self.assertEqual(program_change_msgs[0].program, 42)
 
     def test_add_control_change(self):
         self.track.add_control_change(channel=0, control=1, value=64)
-        control_change_msgs = [
-            msg for msg in self.track.get_track() if msg.type == "control_change"
-        ]
+        control_change_msgs = _bucket(self.track.get_track())["control_change"]
         self.assertEqual(len(control_change_msgs), 1)
         self.assertEqual(control_change_msgs[0].value, 64)
 
     def test_add_pitch_bend(self):
         self.track.add_pitch_bend(channel=0, value=8191)
-        pitch_bend_msgs = [
-            msg for msg in self.track.get_track() if msg.type == "pitchwheel"
-        ]
+        pitch_bend_msgs = _bucket(self.track.get_track())["pitchwheel"]
         self.assertEqual(len(pitch_bend_msgs), 1)
         self.assertEqual(pitch_bend_msgs[0].pitch, 8191)
 
-    def test_invalid_control_change(self):
-        with self.assertRaises(ValueError):
-            self.track.add_control_change(channel=-1, control=0, value=64)
-
-        with self.assertRaises(ValueError):
-            self.track.add_control_change(channel=16, control=0, value=64)
-
-        with self.assertRaises(ValueError):
-            self.track.add_control_change(channel=0, control=-1, value=64)
+    def test_add_control_changes(self):
+        self.track.add_control_changes(channel=0, control=7, changes=[(0, 0), (64, 240), (127, 480)])
+        control_change_msgs = _bucket(self.track.get_track())["control_change"]
+        self.assertEqual([(msg.value, msg.time) for msg in control_change_msgs], [(0, 0), (64, 240), (127, 240)])
 
+    def test_add_pitch_bends_invalid_value_adds_nothing(self):
         with self.assertRaises(ValueError):
-            self.track.add_control_change(channel=0, control=120, value=64)
+            self.track.add_pitch_bends(channel=0, bends=[(0, 0), (8192, 240)])
+        self.assertNotIn("pitchwheel", _bucket(self.track.get_track()))
 
-        with self.assertRaises(ValueError):
-            self.track.add_control_change(channel=0, control=0, value=-1)
-
-        with self.assertRaises(ValueError):
-            self.track.add_control_change(channel=0, control=0, value=128)
+    def test_invalid_control_change(self):
+        for kwargs in (
+            dict(channel=-1, control=0, value=64),
+            dict(channel=16, control=0, value=64),
+            dict(channel=0, control=-1, value=64),
+            dict(channel=0, control=120, value=64),
+            dict(channel=0, control=0, value=-1),
+            dict(channel=0, control=0, value=128),
+            dict(channel=0, control=0, value=64, time=-1),
+        ):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                self.track.add_control_change(**kwargs)
 
     def test_invalid_pitch_bend(self):
-        with self.assertRaises(ValueError):
-            self.track.add_pitch_bend(channel=-1, value=8192)
-
-        with self.assertRaises(ValueError):
-            self.track.add_pitch_bend(channel=16, value=8192)
-
-        with self.assertRaises(ValueError):
-            self.track.add_pitch_bend(channel=0, value=-8193)
-
-        with self.assertRaises(ValueError):
-            self.track.add_pitch_bend(channel=0, value=8193)
+        for kwargs in (
+            dict(channel=-1, value=8192),
+            dict(channel=16, value=8192),
+            dict(channel=0, value=-8193),
+            dict(channel=0, value=8193),
+        ):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                self.track.add_pitch_bend(**kwargs)
 
     def test_chord_notes_start_simultaneously(self):
         # Create notes for a C major chord
-        note_c = Note(pitch=KEY_MAP["C4"], velocity=64, duration=480, time=0)
-        note_e = Note(pitch=KEY_MAP["E4"], velocity=64, duration=480, time=0)
-        note_g = Note(pitch=KEY_MAP["G4"], velocity=64, duration=480, time=0)
+        note_c = Note(pitch=C4, velocity=64, duration=480, time=0)
+        note_e = Note(pitch=E4, velocity=64, duration=480, time=0)
+        note_g = Note(pitch=G4, velocity=64, duration=480, time=0)
 
         # Create a chord and add it to the track
         c_major_chord = Chord([note_c, note_e, note_g])
@@ -160,6 +239,98 @@ class TestTrack(unittest.TestCase):
                 f"Note on at index {i} did not start at expected time 0",
             )
 
+    def test_compile_sequential_notes_delta_times(self):
+        self.track.add_note(Note(C4, 64, 480, 0))
+        self.track.add_note(Note(E4, 64, 480, 480))
+        messages = self.track.compile()[3:]
+
+        self.assertEqual(
+            [(msg.type, msg.note, msg.time) for msg in messages],
+            [
+                ("note_on", C4, 0),
+                ("note_off", C4, 480),
+                ("note_on", E4, 0),
+                ("note_off", E4, 480),
+            ],
+        )
+
+    def test_compile_overlapping_notes_delta_times(self):
+        self.track.add_note(Note(C4, 64, 480, 0))
+        self.track.add_note(Note(E4, 64, 480, 240))
+        messages = self.track.compile()[3:]
+
+        self.assertEqual(
+            [(msg.type, msg.note, msg.time) for msg in messages],
+            [
+                ("note_on", C4, 0),
+                ("note_on", E4, 240),
+                ("note_off", C4, 240),
+                ("note_off", E4, 240),
+            ],
+        )
+
+    def test_compile_zero_duration_note_is_released_after_it_starts(self):
+        drum_kit = DrumKit()
+        drum_kit.add_drum("Acoustic Snare", duration=0)
+        drum_kit.add_drum("Acoustic Snare", duration=0, time=240)
+        self.track.add_drum_kit(drum_kit)
+        messages = self.track.compile()[3:]
+
+        self.assertEqual(
+            [(msg.type, msg.note, msg.time) for msg in messages],
+            [
+                ("note_on", 38, 0),
+                ("note_off", 38, 0),
+                ("note_on", 38, 240),
+                ("note_off", 38, 0),
+            ],
+        )
+
+    def test_compile_merges_control_changes_by_time(self):
+        self.track.add_note(Note(C4, 64, 480, 0))
+        self.track.add_control_change(channel=0, control=1, value=64, time=240)
+        messages = self.track.compile()[3:]
+
+        self.assertEqual(
+            [(msg.type, msg.time) for msg in messages],
+            [("note_on", 0), ("control_change", 240), ("note_off", 240)],
+        )
+
+    def test_set_meta_replaces_existing_message(self):
+        self.track.add_program_change(channel=0, program=42)
+        self.track.set_tempo(90)
+        self.track.apply_global_settings(100, (3, 4), Key("D"))
+        messages = _bucket(self.track.get_track())
+
+        self.assertEqual(len(messages["set_tempo"]), 1)
+        self.assertEqual(messages["set_tempo"][0].tempo, bpm2tempo(100))
+        self.assertEqual(len(messages["time_signature"]), 1)
+        self.assertEqual(len(messages["key_signature"]), 1)
+        self.assertEqual(len(messages["program_change"]), 1)
+
+    def test_tracks_do_not_share_meta_messages(self):
+        other_track = self.midi_gen.add_track()
+        self.track.set_time_signature(3, 4)
+        other_track.set_time_signature(3, 4)
+
+        self.assertEqual(self.track.track[1], other_track.track[1])
+        self.assertIsNot(self.track.track[1], other_track.track[1])
+
+    def test_compile_reflects_later_changes(self):
+        note = Note(C4, 64, 480, 0)
+        self.track.add_note(note)
+        first = self.track.compile()
+        first[-1].time += 1000
+        self.assertEqual(self.track.compile()[-1].time, 480)
+
+        note.time = 480
+        self.track.get_notes().append(Note(E4, 64, 480, 960))
+        messages = self.track.compile()[3:]
+        self.assertEqual(
+            [(msg.type, msg.note, msg.time) for msg in messages],
+            [("note_on", C4, 480), ("note_off", C4, 480), ("note_on", E4, 0), ("note_off", E4, 480)],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,22 +1,55 @@
 from mido import MidiTrack, Message, MetaMessage, bpm2tempo
-from typing import List
+from functools import lru_cache
+from math import floor
+from operator import itemgetter
+from typing import Iterable, List, Optional, Tuple
 
 
 from midigen.chord import Chord, ChordProgression, Arpeggio
 from midigen.key import Key
-from midigen.note import Note
+from midigen.note import Note, NOTE_ON, NOTE_OFF
 from midigen.drums import DrumKit
 
 
 MAX_MIDI_TICKS = 32767  # Maximum value for a 15-bit signed integer
 
 
+# Cached meta message prototypes. Tracks store a copy of them, which is much cheaper than
+# building and validating a new MetaMessage, and keeps tracks from sharing mutable messages.
+@lru_cache(maxsize=256)
+def _tempo_meta(bpm: int) -> MetaMessage:
+    return MetaMessage('set_tempo', tempo=bpm2tempo(bpm))
+
+
+@lru_cache(maxsize=64)
+def _time_signature_meta(numerator: int, denominator: int) -> MetaMessage:
+    return MetaMessage('time_signature', numerator=numerator, denominator=denominator)
+
+
+@lru_cache(maxsize=64)
+def _key_signature_meta(key: Key) -> MetaMessage:
+    return MetaMessage('key_signature', key=str(key))
+
+
+def _check_int_range(name: str, value: int, minimum: int, maximum: Optional[int] = None) -> None:
+    """
+    Raise a ValueError unless value is an integer between minimum and maximum inclusive.
+
+    A maximum of None leaves the range unbounded above.
+    """
+    if not isinstance(value, int) or value < minimum or (maximum is not None and value > maximum):
+        bound = f"between {minimum} and {maximum}" if maximum is not None else f"greater than or equal to {minimum}"
+        raise ValueError(f"Invalid {name}: {value}. {name.capitalize()} must be an integer {bound}")
+
+
 class Track:
+    __slots__ = ("track", "notes")
+
     def __init__(self):
         """
         Initialize a new Track instance.
         """
-        self.track = MidiTrack()
+        self.track = []  # Messages with absolute times; compile() builds the MidiTrack
         self.notes = []
     
     def __str__(self):
@@ -25,13 +58,69 @@ class Track:
     def get_notes(self) -> List[Note]:
         return self.notes
 
-    def get_track(self):
-        return self.track
+    def get_track(self) -> MidiTrack:
+        """
+        Return the compiled MidiTrack of this track, see compile().
+
+        The MidiTrack is a new copy on every call. Changing it does not change the track, so add
+        notes and messages through the add_* methods instead.
+        """
+        return self.compile()
+
+    def compile(self) -> MidiTrack:
+        """
+        Build a MidiTrack with delta times from the messages and notes of this track.
+
+        Notes and channel messages are stored with absolute start times, while MIDI files
+        expect the time of each message relative to the previous one. All events are merged
+        in a single sort and their delta times are computed in one pass. At equal times, meta
+        and channel messages come first, then note_off, then note_on, so a note ending where
+        the next one starts is released before it is struck again. A zero-length note is the
+        exception: its own note_off follows its note_on, so it is never left sounding.
+
+        :return: A new MidiTrack ready to be added to a MidiFile.
+        """
+        # Messages, note_on and note_off events are laid out as three separate runs. Notes are
+        # usually added in time order, so the runs are presorted and the sort only merges them.
+        events = [(msg.time, 0, msg) for msg in self.track]
+        events += [(note.time, 2, note) for note in self.notes]
+        events += [(note.time + note.duration, 1 if note.duration else 3, note) for note in self.notes]
+        events.sort(key=itemgetter(0, 1))
+
+        messages = []
+        append = messages.append
+        last_time = 0
+        for abs_time, event_order, event in events:
+            delta_time = abs_time - last_time
+            last_time = abs_time
+            if event_order == 0:
+                # Stored messages keep absolute times, so they are copied rather than shared. An
+                # argument-free copy is cheapest. Channel messages were validated when they were
+                # added, so mido may skip re-checking them; MetaMessage.copy has no such option.
+                if delta_time == event.time:
+                    append(event.copy())
+                elif event.is_meta:
+                    append(event.copy(time=delta_time))
+                else:
+                    append(event.copy(skip_checks=True, time=delta_time))
+            else:
+                # Note has already checked that pitch and velocity are integers in range, so skip
+                # mido's per-field validation
+                append(
+                    Message(
+                        NOTE_ON if event_order == 2 else NOTE_OFF,
+                        note=event.pitch,
+                        velocity=event.velocity,
+                        time=delta_time,
+                        skip_checks=True,
+                    )
+                )
+        return MidiTrack(messages)
     
     def apply_global_settings(self, tempo, time_signature, key_signature):
-        self.track.append(MetaMessage('set_tempo', tempo=bpm2tempo(tempo)))
-        self.track.append(MetaMessage('time_signature', numerator=time_signature[0], denominator=time_signature[1]))
-        self.track.append(MetaMessage('key_signature', key=str(key_signature)))
+        self._set_meta_message(_tempo_meta(tempo).copy())
+        self._set_meta_message(_time_signature_meta(*time_signature).copy())
+        self._set_meta_message(_key_signature_meta(key_signature).copy())
 
     def add_program_change(self, channel: int, program: int) -> None:
         """
@@ -45,12 +134,11 @@ class Track:
             ValueError: If channel or program is not an integer or is outside the valid range.
         """
 
-        if not isinstance(channel, int) or not 0 <= channel <= 15:
-            raise ValueError(f"Invalid channel value: {channel}. Channel must be an integer between 0 and 15")
-        if not isinstance(program, int) or program < 0 or program > 127:
-            raise ValueError(f"Invalid program value: {program}. Program must be an integer between 0 and 127")
+        _check_int_range("channel", channel, 0, 15)
+        _check_int_range("program", program, 0, 127)
 
-        self.track.append(Message("program_change", channel=channel, program=program))
+        # Arguments are validated above, so skip mido's per-field validation
+        self.track.append(Message("program_change", channel=channel, program=program, skip_checks=True))
 
     def add_control_change(self, channel: int, control: int, value: int, time: int = 0) -> None:
         """
@@ -63,14 +151,12 @@ class Track:
             time (int): The time at which to add the control change. Default is 0.
 
         Raises:
-            ValueError: If channel, control, or value are outside of their respective valid ranges.
-        """
-        if not isinstance(channel, int) or not 0 <= channel <= 15:
-            raise ValueError(f"Invalid channel value: {channel}. Channel must be an integer between 0 and 15")
-        if not isinstance(control, int) or not 0 <= control <= 119:
-            raise ValueError(f"Invalid control value: {control}. Control must be an integer between 0 and 119")
-        if not isinstance(value, int) or not 0 <= value <= 127:
-            raise ValueError(f"Invalid value: {value}. Value must be between 0 and 127.")
+            ValueError: If channel, control, value or time are outside of their respective valid ranges.
+        """
+        _check_int_range("channel", channel, 0, 15)
+        _check_int_range("control", control, 0, 119)
+        _check_int_range("value", value, 0, 127)
+        _check_int_range("time", time, 0)
     
         self.track.append(
             Message(
@@ -79,6 +165,7 @@ class Track:
                 control=control,
                 value=value,
                 time=time,
+                skip_checks=True,
             )
         )
 
@@ -91,42 +178,83 @@ class Track:
         :param time: Optional, the time to schedule the pitch bend. Default is 0.
         """
         
-        if not isinstance(channel, int) or not 0 <= channel <= 15:
-            raise ValueError("Invalid channel value: channel must be an integer between 0 and 15")
-        if not isinstance(value, int) or value < -8192 or value > 8191:
-            raise ValueError("Invalid value: value must be an integer between -8192 and 8191")
-        if not isinstance(time, int) or time < 0:
-            raise ValueError("Invalid time value: time must be a non-negative integer")
+        _check_int_range("channel", channel, 0, 15)
+        _check_int_range("value", value, -8192, 8191)
+        _check_int_range("time", time, 0)
 
         self.track.append(
-            Message("pitchwheel", channel=channel, pitch=value, time=time)
+            Message("pitchwheel", channel=channel, pitch=value, time=time, skip_checks=True)
         )
     
+    def add_control_changes(self, channel: int, control: int, changes: Iterable[Tuple[int, int]]) -> None:
+        """
+        Add a series of control change messages for one controller, e.g. a volume ramp.
+
+        :param channel: The MIDI channel to send the messages to. Must be between 0 and 15.
+        :param control: The controller number to change. Must be between 0 and 119.
+        :param changes: (value, time) pairs, each scheduled like add_control_change.
+        :raises ValueError: If any argument is outside its valid range. Nothing is added in that case.
+        """
+        _check_int_range("channel", channel, 0, 15)
+        _check_int_range("control", control, 0, 119)
+
+        messages = []
+        for value, time in changes:
+            _check_int_range("value", value, 0, 127)
+            _check_int_range("time", time, 0)
+            messages.append(
+                Message(
+                    "control_change",
+                    channel=channel,
+                    control=control,
+                    value=value,
+                    time=time,
+                    skip_checks=True,
+                )
+            )
+        self.track.extend(messages)
+
+    def add_pitch_bends(self, channel: int, bends: Iterable[Tuple[int, int]]) -> None:
+        """
+        Add a series of pitch bend messages, e.g. a bend curve.
+
+        :param channel: The MIDI channel for the pitch bends.
+        :param bends: (value, time) pairs, each scheduled like add_pitch_bend.
+        :raises ValueError: If any argument is outside its valid range. Nothing is added in that case.
+        """
+        _check_int_range("channel", channel, 0, 15)
+
+        messages = []
+        for value, time in bends:
+            _check_int_range("value", value, -8192, 8191)
+            _check_int_range("time", time, 0)
+            messages.append(Message("pitchwheel", channel=channel, pitch=value, time=time, skip_checks=True))
+        self.track.extend(messages)
+
     def add_note(self, note: Note) -> None:
         """
         Add a note to the MIDI track.
 
-        This method adds a note to the MIDI track with the specified velocity and duration, starting at the specified time.
-
-        Raises:
-            ValueError: If note, velocity, duration or time is not an integer or outside valid range.
+        The note_on and note_off messages for the note are generated by compile(), starting at
+        the note's time and ending after its duration.
         """
-        note_on_msg = Message("note_on", note=note.pitch, velocity=note.velocity, time=note.time)
-        self.track.append(note_on_msg)
         self.notes.append(note)
+
+    def add_notes(self, notes: List[Note]) -> None:
+        """
+        Add several notes to the MIDI track at once.
+
+        :param notes: The notes to add, each scheduled at its own time like add_note.
+        """
+        self.notes.extend(notes)
     
     def add_note_off_messages(self) -> None:
         """
-        This method is crucial for preventing timing offsets if the sequence 
-        of note_on and note_off messages is not properly managed due to the fundamental design of MIDI
-        
-        Should be called after all notes or chords are added to the track and before the track is saved or further 
-        processed. This is especially important in a live setting or when dynamically adding notes to ensure that 
-        playback reflects the exact intended timing without any shifts.
+        Kept for backwards compatibility.
+
+        note_off messages are now generated, in order and with correct delta times, by compile(),
+        so there is nothing left to do here.
         """
-        for note in self.notes:
-            note_off_msg = Message("note_off", note=note.pitch, velocity=note.velocity, time=(note.time+note.duration))
-            self.track.append(note_off_msg)
 
     def add_rest(self, duration: int, track: int = 0) -> None:
         last_event = self.tracks[track][-1] if self.tracks[track] else None
@@ -141,8 +269,7 @@ class Track:
 
         :param chord: A Chord object.
         """
-        for note in chord.get_chord():
-            self.add_note(note)
+        self.add_notes(chord.get_chord())
 
     def add_chord_progression(self, chord_progression: ChordProgression):
         """
@@ -151,8 +278,7 @@ class Track:
         :param chord_progression: A ChordProgression object.
         :param time: The time at which to start the chord progression.
         """
-        for chord in chord_progression.get_progression():
-            self.add_chord(chord)
+        self.add_notes([note for chord in chord_progression.get_progression() for note in chord.get_chord()])
 
     def add_arpeggio(
         self,
@@ -161,8 +287,7 @@ class Track:
         """
         Add an arpeggio (sequence of notes) to the track.
         """
-        for note in arpeggio.get_sequential_notes():
-            self.add_note(note)
+        self.add_notes(arpeggio.get_sequential_notes())
 
     def add_drum_kit(self, drum_kit: DrumKit) -> None:
         """
@@ -170,8 +295,7 @@ class Track:
 
         :param drum_kit: A DrumKit object.
         """
-        for drum in drum_kit.get_drums():
-            self.add_note(drum)
+        self.add_notes(drum_kit.get_drums())
             
 
     def quantize(self, time_value: int, quantization_value: int) -> int:
@@ -183,33 +307,64 @@ class Track:
         :return: The quantized time value.
         """
 
-        if quantization_value < 0 or time_value < 0:
-            raise ValueError("Time value and quantization value must be non-negative.")
+        if not (time_value >= 0 and 0 < quantization_value <= MAX_MIDI_TICKS):
+            if quantization_value > MAX_MIDI_TICKS:
+                raise ValueError(f"Quantization value must not exceed maximum MIDI ticks: {MAX_MIDI_TICKS}")
+            raise ValueError("Time value must be non-negative and quantization value must be positive.")
 
-        if quantization_value > MAX_MIDI_TICKS:
-            raise ValueError(f"Quantization value must not exceed maximum MIDI ticks: {MAX_MIDI_TICKS}")
-        
-        return round(time_value / quantization_value) * quantization_value
+        if not (isinstance(time_value, int) and isinstance(quantization_value, int)):
+            # The integer fast paths below do not apply to floats. Halves still round up, like them
+            return floor(time_value / quantization_value + 0.5) * quantization_value
+
+        if not quantization_value & (quantization_value - 1):
+            # Power-of-two grids (the common case) round with a mask instead of a division
+            return (time_value + (quantization_value >> 1)) & ~(quantization_value - 1)
 
+        return (time_value + quantization_value // 2) // quantization_value * quantization_value
+
+    def quantize_all(self, quantization_value: int) -> None:
+        """
+        Snap the start time of every note in the track to the nearest multiple of the quantization value.
+
+        Each note is replaced by a new Note at quantize(note.time, quantization_value), so notes shared
+        with chords or other tracks are left untouched. The list returned by get_notes() stays the
+        track's list. If any time is invalid, no note is changed.
+
+        :param quantization_value: The quantization step size.
+        """
+        quantize = self.quantize
+        self.notes[:] = [
+            Note(note.pitch, note.velocity, note.duration, quantize(note.time, quantization_value))
+            for note in self.notes
+        ]
     
     def set_tempo(self, tempo: int) -> None:
         if not isinstance(tempo, int) or tempo <= 0:
             raise ValueError("Invalid tempo value: tempo must be a positive integer")
-        
-        tempo_meta = bpm2tempo(tempo)
-        self.track = [msg for msg in self.track if msg.type != "set_tempo"]
-        self.track.append(MetaMessage('set_tempo', tempo=tempo_meta))
+
+        self._set_meta_message(_tempo_meta(tempo).copy())
 
     def set_time_signature(self, numerator: int, denominator: int) -> None:
         if not (isinstance(numerator, int) and isinstance(denominator, int)) or numerator <= 0 or denominator <= 0:
             raise ValueError("Invalid time signature values: numerator and denominator must be positive integers")
 
-        self.track = [msg for msg in self.track if msg.type != "time_signature"]
-        self.track.append(MetaMessage('time_signature', numerator=numerator, denominator=denominator))
+        self._set_meta_message(_time_signature_meta(numerator, denominator).copy())
 
     def set_key_signature(self, key: Key) -> None:
         if not isinstance(key, Key):
             raise ValueError("Invalid key signature: must be a Key object")
 
-        self.track = [msg for msg in self.track if msg.type != "key_signature"]
-        self.track.append(MetaMessage('key_signature', key=str(key)))
+        self._set_meta_message(_key_signature_meta(key).copy())
+
+    def _set_meta_message(self, meta_message: MetaMessage) -> None:
+        """
+        Replace the meta message of the same type with the given one, in place, or append it.
+
+        The values of the message must already be validated by the caller.
+        """
+        # apply_global_settings adds the meta messages first, so the scan stops within a few entries
+        for index, msg in enumerate(self.track):
+            if msg.type == meta_message.type:
+                self.track[index] = meta_message
+                return
+        self.track.append(meta_message)